@@ -15,11 +15,11 @@ Description:
 from is_matrix_forge.led_matrix import get_controllers
 from ismf_battery_monitor.monitor import PowerMonitor
 
-CONTROLLERS = get_controllers(threaded=True)
-
 
 def main():
-    pm = PowerMonitor(CONTROLLERS[0])
+    # Enumerating controllers scans the serial ports, so only do it when actually running.
+    controllers = get_controllers(threaded=True)
+    pm = PowerMonitor(controllers[0])
 
 
 if __name__ == '__main__':
@@ -18,14 +18,14 @@ from easy_exit_calls import ExitCallHandler
 from ismf_battery_monitor.errors import *
 from ismf_battery_monitor.helpers import get_plugged_status
 from is_matrix_forge.log_engine import ROOT_LOGGER as PARENT_LOGGER
-from ismf_battery_monitor.notify.sounds import PLUGGED_NOTIFY, UNPLUGGED_NOTIFY
+from ismf_battery_monitor.notify.sounds import get_sound
 from ismf_battery_monitor.monitor import PowerMonitor
 
 
 # -- END IMPORTS --
 
-DEFAULT_PLUGGED_SOUND   = PLUGGED_NOTIFY
-DEFAULT_UNPLUGGED_SOUND = UNPLUGGED_NOTIFY
+DEFAULT_PLUGGED_SOUND   = get_sound('plugged')
+DEFAULT_UNPLUGGED_SOUND = get_sound('unplugged')
 
 ECH = ExitCallHandler()
 
@@ -34,7 +34,7 @@ MOD_LOGGER = PARENT_LOGGER.get_child('monitor')
 
 def run_power_monitor(
         device:                 ListPortInfo,
-        battery_check_interval: int = 5,
+        battery_check_interval: Optional[Union[int, float, str]] = None,
         plugged_alert:          Optional[Union[str, Path]] = DEFAULT_PLUGGED_SOUND,
         unplugged_alert:        Optional[Union[str, Path]] = DEFAULT_UNPLUGGED_SOUND,
 ):
@@ -46,7 +46,8 @@ def run_power_monitor(
             The LED matrix on which to display the battery level.
 
         battery_check_interval (Optional[Union[int, float, str]]):
-            The interval (in seconds) at which to check the battery level.
+            The interval (in seconds) at which to check the battery level. If not provided, the monitor checks less
+            often while on battery than while plugged in.
 
         plugged_alert (Optional[Union[str, Path]]):
             The filepath to the sound to play when the device is plugged into power.
@@ -1,9 +1,32 @@
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 from inspyre_toolbox.syntactic_sweets.classes.decorators import validate_type
 
 
+DEFAULT_MAP_PATH = Path(__file__).parent / 'char_map.json'
+
+
+@lru_cache(maxsize=1)
+def _load_default_map(path: str) -> MappingProxyType:
+    """
+    Load and parse the default font map once, sharing the result between instances.
+
+    The returned mapping (and each of its sections) is read-only, so the cached copy can't be
+    mutated by one instance out from under another; the glyphs themselves are copied per instance
+    by `FontMap._build_indexes`.
+    """
+    with open(path, 'rb') as f:
+        font_map = json.load(f)
+
+    return MappingProxyType({
+        section: MappingProxyType(entries) if isinstance(entries, dict) else entries
+        for section, entries in font_map.items()
+    })
+
+
 class FontMap:
     """
     FontMap allows lookup of character and symbol patterns from a JSON-based font map.
@@ -30,30 +53,37 @@ class FontMap:
         """
         # Lazy-load from JSON if not provided
         if font_map is None:
-            map_path = Path(__file__).parent / 'font_map.json'
-            font_map = json.load(open(map_path))
+            font_map = _load_default_map(str(DEFAULT_MAP_PATH))
 
         self._map = font_map
         self._characters_key = characters_key
         self._symbols_key = symbols_key
         self._case_sensitive = case_sensitive
         self._fallback_char = fallback_char or self.DEFAULT_FALLBACK_CHAR
+        self._lookup_cache: Dict[tuple, Union[Tuple[int, ...], bytes]] = {}
+        self._build_indexes()
 
     @property
-    def character_map(self) -> Dict[str, List[int]]:
-        return self._map[self._characters_key]
+    def character_map(self) -> Dict[str, Tuple[int, ...]]:
+        return self._character_map
 
     @property
-    def symbol_map(self) -> Dict[str, List[int]]:
-        return self._map[self._symbols_key]
+    def symbol_map(self) -> Dict[str, Tuple[int, ...]]:
+        return self._symbol_map
 
     @property
-    def characters(self) -> List[str]:
-        return list(self.character_map.keys())
+    def characters(self) -> Tuple[str, ...]:
+        """
+        The keys of the character map. Built once per (re)load; copy to a list if you need to modify it.
+        """
+        return self._characters
 
     @property
-    def symbols(self) -> List[str]:
-        return list(self.symbol_map.keys())
+    def symbols(self) -> Tuple[str, ...]:
+        """
+        The keys of the symbol map. Built once per (re)load; copy to a list if you need to modify it.
+        """
+        return self._symbols
 
     @property
     def fallback_char(self) -> str:
@@ -63,9 +93,10 @@ class FontMap:
     def fallback_char(self, new: str):
         if not isinstance(new, str) or len(new) != 1:
             raise ValueError('fallback_char must be a single character string')
-        if new not in self.characters + self.symbols:
+        if new not in self._valid_keys:
             raise ValueError(f'{new!r} not found in font map')
         self._fallback_char = new
+        self._lookup_cache.clear()
 
     @property
     def is_case_sensitive(self) -> bool:
@@ -75,10 +106,11 @@ class FontMap:
     @is_case_sensitive.setter
     def is_case_sensitive(self, new: bool):
         self._case_sensitive = new
+        self._lookup_cache.clear()
 
     def __contains__(self, key: str) -> bool:
         key_norm = self._normalize_key(key)
-        return key_norm in self.character_map or key_norm in self.symbol_map
+        return key_norm in self._character_map or key_norm in self._symbol_map
 
     def __repr__(self):
         return (
@@ -89,31 +121,83 @@ class FontMap:
     def lookup(self, key: str, kind: Optional[str] = None) -> List[int]:
         """
         Lookup a character or symbol. If kind is 'character' or 'symbol', force that map.
+
+        Glyph resolution is memoized per `(key, kind)` until the map, fallback character, or case-sensitivity
+        changes; each call returns a fresh list, so callers can't alter the stored glyph.
         """
-        key_norm = self._normalize_key(key)
-        if kind == 'symbol':
-            return self._lookup_map(self.symbol_map, key_norm)
-        if kind in ('char', 'character'):
-            return self._lookup_map(self.character_map, key_norm)
+        return list(self._cached_lookup(key, kind, packed=False))
+
+    def raw_lookup(self, key: str, kind: Optional[str] = None) -> bytes:
+        """
+        Lookup a character or symbol, returning its pattern packed as `bytes` (one byte per pixel).
 
-        # Try characters first, then symbols
-        try:
-            return self._lookup_map(self.character_map, key_norm)
-        except KeyError:
-            return self._lookup_map(self.symbol_map, key_norm)
+        Behaves exactly like `lookup`, but returns the glyph precomputed at load time, so draw code can
+        walk contiguous memory instead of a list of Python ints.
+        """
+        return self._cached_lookup(key, kind, packed=True)
 
     def reload(self, font_map: Union[str, Path, Dict]):
         """
         Reloads font map from a file path or dict.
         """
         if isinstance(font_map, (str, Path)):
-            font_map = json.load(open(font_map))
+            with open(font_map, 'rb') as f:
+                font_map = json.load(f)
         self._map = font_map
+        self._lookup_cache.clear()
+        self._build_indexes()
+
+    def _cached_lookup(self, key: str, kind: Optional[str], packed: bool) -> Union[Tuple[int, ...], bytes]:
+        cache_key = (key, kind, packed)
+        cached = self._lookup_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if packed:
+            characters, symbols = self._packed_characters, self._packed_symbols
+        else:
+            characters, symbols = self._character_map, self._symbol_map
+
+        key_norm = self._normalize_key(key)
+        if kind == 'symbol':
+            pattern = self._lookup_map(symbols, key_norm)
+        elif kind in ('char', 'character'):
+            pattern = self._lookup_map(characters, key_norm)
+        else:
+            # Try characters first, then symbols, then the fallback from whichever map defines it
+            pattern = characters.get(key_norm)
+            if pattern is None:
+                pattern = symbols.get(key_norm)
+            if pattern is None:
+                fallback = self._fallback_char
+                pattern = characters[fallback] if fallback in characters else symbols[fallback]
+
+        self._lookup_cache[cache_key] = pattern
+        return pattern
+
+    def _build_indexes(self):
+        """
+        Rebuild everything derived from the current map; the resolved sections, key listings, packed glyphs and
+        the set of known keys.
+
+        Glyphs are stored as tuples whichever way the map was loaded (default, file, or dict), so the stored
+        patterns are immutable and of one type.
+        """
+        self._character_map = {k: tuple(v) for k, v in self._map[self._characters_key].items()}
+        self._symbol_map = {k: tuple(v) for k, v in self._map[self._symbols_key].items()}
+        self._characters = tuple(self._character_map)
+        self._symbols = tuple(self._symbol_map)
+        self._valid_keys = frozenset(self._character_map) | frozenset(self._symbol_map)
+        self._packed_characters = {k: bytes(v) for k, v in self._character_map.items()}
+        self._packed_symbols = {k: bytes(v) for k, v in self._symbol_map.items()}
 
     def _normalize_key(self, key: str) -> str:
         return key if self._case_sensitive else key.upper()
 
-    def _lookup_map(self, mapping: Dict[str, List[int]], key: str) -> List[int]:
-        if key not in mapping:
-            key = self._fallback_char
-        return mapping[key]
+    def _lookup_map(
+        self,
+        mapping: Mapping[str, Union[Tuple[int, ...], bytes]],
+        key: str
+    ) -> Union[Tuple[int, ...], bytes]:
+        pattern = mapping.get(key)
+        return pattern if pattern is not None else mapping[self._fallback_char]
@@ -15,10 +15,12 @@ class PowerMonitorNotRunningError(PowerMonitorError):
     """
     Raised when a method is called on a PowerMonitor instance that is not running, but should be to perform the action.
     """
+    default_message = 'The PowerMonitor is not running, can not perform action on a non-running instance!'
+
     def __init__(self, message = None):
-        msg = 'The PowerMonitor is not running, can not perform action on a non-running instance!'
+        msg = self.default_message
         if message is not None:
-            msg += f'\n\nAdditional information from caller: {message}'
+            msg = f'{msg}\n\nAdditional information from caller: {message}'
 
         super().__init__(msg)
 
@@ -27,9 +29,11 @@ class BatteryStateUnknownError(PowerMonitorError):
     """
     Raised when the state of the battery cannot be determined.
     """
+    default_message = 'The state of the battery cannot be determined!'
+
     def __init__(self, message = None):
-        msg = 'The state of the battery cannot be determined!'
+        msg = self.default_message
         if message is not None:
-            msg += f'\n\nAdditional information from caller: {message}'
+            msg = f'{msg}\n\nAdditional information from caller: {message}'
 
         super().__init__(msg)
@@ -1,8 +1,20 @@
+from types import MappingProxyType
+
 from is_matrix_forge.log_engine import ROOT_LOGGER
 from .monitor import PowerMonitor
-from .helpers import get_battery_percentage
+from .helpers import get_battery_percentage, get_plugged_status
 
 MOD_LOGGER = ROOT_LOGGER.get_child('monitor.events')
+HANDLE_EVENT_LOGGER = MOD_LOGGER.get_child('handle_event')
+
+EVENT_MAP = MappingProxyType({
+    'on':        True,
+    'true':      True,
+    'plugged':   True,
+    'off':       False,
+    'false':     False,
+    'unplugged': False,
+})
 
 
 def event_to_bool(event: str) -> bool:
@@ -32,38 +44,56 @@ def event_to_bool(event: str) -> bool:
         ValueError: invalid is not a valid boolean value.
     """
     event = event.lower().strip()
-    print(event)
+    result = EVENT_MAP.get(event)
 
-    if event in ['on', 'true', 'plugged']:
-        return True
-    elif event in ['off', 'false', 'unplugged']:
-        return False
-    else:
+    if result is None:
         raise ValueError(f'{event} is not a valid boolean value.')
 
+    return result
+
 
 def __handle_device_plugged_in(power_monitor):
     pm = power_monitor
-    print(f'plugged in {pm.plugged_in}')
-    if pm.plugged_in and not pm.controller.is_animating and (not pm.last_state or pm.last_state is None):
+    # Judge by the reading the monitor took this cycle (if any), so handling an event doesn't query the battery again.
+    if get_plugged_status(pm._last_snapshot) and not pm.controller.is_animating and (not pm.last_state or pm.last_state is None):
         pm.notify('plugged')
         pm.controller.clear()
         pm._last_state = True
+        pm._last_drawn_percentage = None
 
 
 def __handle_device_unplugged(power_monitor):
     pm = power_monitor
-    if pm.unplugged and not pm.controller.is_animating and (pm.last_state or pm.last_state is None):
+    if not get_plugged_status(pm._last_snapshot) and not pm.controller.is_animating and (pm.last_state or pm.last_state is None):
         pm.notify('unplugged')
         pm.controller.clear()
         pm._last_state = False
+        pm._last_drawn_percentage = None
+
+    refresh_percentage(pm)
+
+
+def refresh_percentage(power_monitor: PowerMonitor):
+    """
+    Draws the current battery percentage on the power monitor's LED matrix, if it differs from what is already shown.
+
+    Parameters:
+        power_monitor (PowerMonitor):
+            The power monitor whose LED matrix should display the battery percentage.
+    """
+    pm = power_monitor
 
-    pm.controller.draw_percentage(get_battery_percentage())
+    # Only push a redraw to the matrix when the percentage changed (or the display was cleared).
+    snapshot = pm._last_snapshot
+    percentage = snapshot.percent if snapshot is not None else get_battery_percentage()
+    if percentage != pm._last_drawn_percentage:
+        pm.controller.draw_percentage(percentage)
+        pm._last_drawn_percentage = percentage
 
 
 def handle_event(event: str, power_monitor: PowerMonitor):
-    log = MOD_LOGGER.get_child('handle_event')
-    log.debug(f'Handling {event}...')
+    log = HANDLE_EVENT_LOGGER
+    log.debug('Handling %s...', event)
 
     #if not isinstance(power_monitor, PowerMonitor):
     #    raise TypeError(f'{power_monitor} is not a PowerMonitor instance.')
@@ -71,7 +101,6 @@ def handle_event(event: str, power_monitor: PowerMonitor):
     #   log.debug(f'{power_monitor} is a PowerMonitor instance.')
 
     event = event_to_bool(event)
-    print(event)
 
     pm = power_monitor
 
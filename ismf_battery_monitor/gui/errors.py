@@ -28,8 +28,9 @@ class MalformedWindowError(PowerMonitorGUIError):
             message (Optional[str]):
                 The error message to be displayed. If None, uses the default message.
         """
+        msg = self.default_message
         if message is not None:
-            self.default_message = f"{self.default_message}\n\n  Additional information from caller:\n    {message}"
+            msg = f"{msg}\n\n  Additional information from caller:\n    {message}"
 
-        super().__init__(message=self.default_message, **kwargs)
+        super().__init__(message=msg, **kwargs)
 
@@ -1,12 +1,10 @@
 from __future__ import annotations
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from .event import MOD_LOGGER as __MOD_LOGGER, Event, Loggable
+from .event import MOD_LOGGER as __MOD_LOGGER, Event, ExitEvent, Loggable
 from .errors import EventExistsError, EventLookupError
 
-__initialized = False
-
-if __initialized:
+if TYPE_CHECKING:
     from ..windows.base import WindowBase
 
 
@@ -21,39 +19,37 @@ class EventCollection(Loggable):
         """
         Initializes an EventCollection instance.
 
-        This constructor sets up the logging and initializes an empty list to hold events.
+        This constructor sets up the logging and initializes an empty mapping of event keys to events.
         """
         super().__init__(MOD_LOGGER)
-        self.__events = []
+        self.__events: dict[Optional[str], Event] = {}
 
     def __iter__(self):
-        return iter(self.__events)
+        return iter(self.__events.values())
 
     def __len__(self):
         return len(self.__events)
 
     @property
     def event_names(self):
-        return [e.key for e in self.__events]
+        return list(self.__events.keys())
 
     @property
     def events(self):
-        return self.__events
+        return list(self.__events.values())
 
     @property
     def exit_event_exists(self) -> bool:
         """
         Checks if an ExitEvent exists in the collection.
 
-        This method checks if any events in the collection are an instance of ExitEvent.
+        The ExitEvent is the only event stored under the `None` key, so this is a single membership check.
 
         Returns:
             bool:
                 True if an ExitEvent exists in the collection, False otherwise.
         """
-        from ..event.event import ExitEvent
-
-        return any(isinstance(event, ExitEvent) for event in self.events)
+        return None in self.__events
 
     @property
     def times_failed(self):
@@ -68,57 +64,64 @@ class EventCollection(Loggable):
             int:
                 The total number of times all events in the collection have failed.
         """
-        times = 0
-
-        if self.events:
-            for event in self.events:
-                times += event.times_failed
-        else:
+        if not self.__events:
             self.method_logger.warn_once('No events in collection, returning 0')
+            return 0
 
-        return times
+        return sum(event.times_failed for event in self.__events.values())
 
     @property
     def times_handled(self) -> int:
-        times = 0
-
-        if self.events:
-            for event in self.events:
-                times += event.times_handled
-        else:
+        if not self.__events:
             self.method_logger.warn_once('No events in collection, returning 0')
+            return 0
 
-        return times
+        return sum(event.times_handled for event in self.__events.values())
 
     def add_event(self, event: Event) -> None:
         if not isinstance(event, Event):
             raise TypeError(f"event must be of type `Event`, not {type(event)}")
 
-        if event.key in self.event_names:
+        # `Event.key` is upper-cased once when set, so it can be used as the storage key as-is.
+        assert event.key is None or event.key == event.key.upper(), 'Event keys must be stored upper-case'
+
+        if event.key in self.__events:
             raise EventExistsError(event_name=event.key)
 
-        self.__events.append(event)
+        self.__events[event.key] = event
 
     def clear(self) -> None:
         self.method_logger.info('Clearing all events in collection...')
-        self.events.clear()
+        self.__events.clear()
 
     def create_event(self, key: str, callback: Optional[callable] = None) -> None:
         if key is None and self.exit_event_exists:
             raise EventExistsError(event_name='ExitEvent')
         elif key is None and not self.exit_event_exists:
-            from ..event.event import ExitEvent
             return self.add_event(ExitEvent())
 
         key = key.upper()
 
-        if key in self.event_names:
+        if key in self.__events:
             raise EventExistsError(event_name=key)
 
         return self.add_event(Event(key=key, callback=callback))
 
+    def get(self, key: Optional[str]) -> Optional[Event]:
+        """
+        Gets the event stored under `key`, without normalizing or type-checking it first.
+
+        Parameters:
+            key (Optional[str]):
+                The upper-case key of the event, or `None` for the ExitEvent.
+
+        Returns:
+            Event or None:
+                The event stored under `key`, or None if there isn't one.
+        """
+        return self.__events.get(key)
+
     def handle_event(self, event: str, callback_args: tuple = (), callback_kwargs: Optional[dict] = None):
-        print('Reached handle_event')
         event = self.lookup(event)
 
         if event is None:
@@ -145,9 +148,4 @@ class EventCollection(Loggable):
         if not isinstance(event_key, str):
             raise TypeError(f"'event_key' must be of type `str`, not {type(event_key)}")
 
-        return next(
-            (e for e in self.__events if e.key.lower() == event_key.lower()), None
-        )
-
-
-__initialized = True
+        return self.__events.get(event_key.upper())
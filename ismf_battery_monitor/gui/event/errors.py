@@ -23,12 +23,13 @@ class EventExistsError(EventError, ValueError):
             message (Optional[str]):
                 The error message to be displayed. If None, uses the default message.
         """
+        msg = self.default_message
         if event_name is not None:
-            self.default_message = f"'{event_name}' already exists in collection!"
+            msg = f"'{event_name}' already exists in collection!"
         if message is not None:
-            self.default_message = f"{self.default_message}\n\n  Additional information from caller:\n    {message}"
+            msg = f"{msg}\n\n  Additional information from caller:\n    {message}"
 
-        super().__init__(message=self.default_message, skip_print=skip_print)
+        super().__init__(message=msg, skip_print=skip_print)
 
 
 class EventLookupError(EventError, ValueError):
@@ -48,11 +49,12 @@ class EventLookupError(EventError, ValueError):
             message (Optional[str]):
                 The error message to be displayed. If None, uses the default message.
         """
+        msg = self.default_message
         if event_name is not None:
-            self.default_message = f"'{event_name}' not found in collection!"
+            msg = f"'{event_name}' not found in collection!"
         if message is not None:
-            self.default_message = f"{self.default_message}\n\n  Additional information from caller:\n    {message}"
+            msg = f"{msg}\n\n  Additional information from caller:\n    {message}"
 
         self.__additional_info = 'Test'
 
-        super().__init__(message=self.default_message, skip_print=skip_print)
+        super().__init__(message=msg, skip_print=skip_print)
@@ -1,21 +1,18 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from is_matrix_forge.log_engine import ROOT_LOGGER as PARENT_LOGGER, Loggable
 from dataclasses import dataclass, field
 
 
-__initialized = False
-
-
-if __initialized:
+if TYPE_CHECKING:
     from ..windows.base import WindowBase
 
 
 MOD_LOGGER = PARENT_LOGGER.get_child('monitor.gui.event.event')
 
 
-@dataclass
+@dataclass(slots=True)
 class ElementArgMap():
     pos_args: tuple = field(default_factory=tuple)
     kw_args: dict = field(default_factory=dict)
@@ -220,7 +217,3 @@ class ExitEvent(Event):
     @key.setter
     def key(self, new: None) -> None:
         raise ValueError('The key of an ExitEvent cannot be set.')
-
-
-__initialized = True
-
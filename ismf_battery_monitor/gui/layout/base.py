@@ -35,12 +35,36 @@ class LayoutAlreadyBuiltError(LayoutError):
 LOGGER = ROOT_LOGGER.get_child('monitor.gui.layout.base')
 
 
+def clone_blueprint(blueprint):
+    """
+    Copy a 2D blueprint of `PySimpleGUI` elements so that it can be handed to a new window.
+
+    A window only rebinds attributes on the elements it finalizes, so a shallow copy of each element is enough for
+    plain elements. Container elements (those holding their own `Rows`) are deep-copied so their children are not
+    shared; those copies share one `memo`, so objects referenced from several containers are copied only once.
+
+    Parameters:
+        blueprint (Sequence[Sequence[PySimpleGUI.Element]]):
+            The blueprint to copy; rows may be lists or tuples.
+
+    Returns:
+        List[List[PySimpleGUI.Element]]:
+            The copied blueprint.
+    """
+    memo = {}
+
+    return [
+        [copy.deepcopy(element, memo) if hasattr(element, 'Rows') else copy.copy(element) for element in row]
+        for row in blueprint
+    ]
+
+
 class Layout(Loggable, metaclass=SingletonABCMeta):
 
     @property
     @abstractmethod
     def BLUEPRINT(self):
-        """Return a 2D list of PySimpleGUI elements used to build this layout."""
+        """Return a 2D list (or tuple) of PySimpleGUI elements used to build this layout."""
         raise NotImplementedError
 
     def __init__(self, with_logging_parent=None):
@@ -49,6 +73,9 @@ class Layout(Loggable, metaclass=SingletonABCMeta):
 
         super().__init__(with_logging_parent)
 
+        # `method_logger` inspects the call stack on every access; resolve a logger once instead.
+        self._log = self.class_logger
+
         self.__layout   = None
         self.__is_built = False
 
@@ -66,7 +93,10 @@ class Layout(Loggable, metaclass=SingletonABCMeta):
     @property
     def layout(self):
         """
-        Get a fresh deep-copy of the built layout.
+        Get the built layout.
+
+        Note:
+            PySimpleGUI elements can only belong to one window; use `Layout.clone` if you need an independent copy.
 
         Returns:
             List[List[PySimpleGUI.Element]]:
@@ -76,7 +106,7 @@ class Layout(Loggable, metaclass=SingletonABCMeta):
             LayoutNotBuiltError:
                 If the layout has not been built yet.
         """
-        log = self.method_logger
+        log = self._log
         if not self.built:
             log.warning('Attempted to access layout before it was built!')
             raise LayoutNotBuiltError()
@@ -86,8 +116,7 @@ class Layout(Loggable, metaclass=SingletonABCMeta):
             log.warning(err_msg)
             raise LayoutNotBuiltError(err_msg)
 
-        log.debug('Returning a deep-copy of the layout.')
-        return copy.deepcopy(self.__layout)
+        return self.__layout
 
     def build(self):
         """
@@ -95,27 +124,42 @@ class Layout(Loggable, metaclass=SingletonABCMeta):
 
         Returns:
             List[List[PySimpleGUI.Element]]:
-                A 2D list of `PySimpleGUI` elements representing the layout, deep-copied.
+                A 2D list of `PySimpleGUI` elements representing the layout, copied from `BLUEPRINT`.
 
         Raises:
             LayoutAlreadyBuiltError:
                 If the layout has already been built.
         """
-        log = self.method_logger
+        log = self._log
         if self.built:
             log.warning('Attempted to build layout when it was already built!')
             raise LayoutAlreadyBuiltError()
 
         blueprint = self.BLUEPRINT
-        if not isinstance(blueprint, list) or not all(isinstance(r, list) for r in blueprint):
-            raise LayoutError('BLUEPRINT must be a 2D list of PySimpleGUI elements.')
+        # BLUEPRINT is author-controlled, so its shape is only verified in debug runs (stripped under `python -O`).
+        if __debug__ and (
+                not isinstance(blueprint, (list, tuple)) or not all(isinstance(r, (list, tuple)) for r in blueprint)
+        ):
+            raise LayoutError('BLUEPRINT must be a 2D list (or tuple) of PySimpleGUI elements.')
 
-        self.__layout   = copy.deepcopy(blueprint)
-        log.debug('Layout built successfully.')
+        self.__layout   = clone_blueprint(blueprint)
         self.__is_built = True
-        log.debug('Marked layout as built.')
+        log.debug('Layout built and marked as built.')
+
+        return self.__layout
 
-        return self.layout
+    def clone(self):
+        """
+        Get an independent copy of the layout, made from `BLUEPRINT`.
+
+        The copy is taken from the blueprint rather than the built layout, as the built layout's elements have already
+        been handed to (and finalized by) a window.
+
+        Returns:
+            List[List[PySimpleGUI.Element]]:
+                A fresh 2D list of `PySimpleGUI` elements representing the layout.
+        """
+        return clone_blueprint(self.BLUEPRINT)
 
     def rebuild(self):
         """
@@ -123,25 +167,20 @@ class Layout(Loggable, metaclass=SingletonABCMeta):
 
         Returns:
             List[List[PySimpleGUI.Element]]:
-                A 2D list of `PySimpleGUI` elements representing the layout, deep-copied.
+                A 2D list of `PySimpleGUI` elements representing the layout, copied from `BLUEPRINT`.
 
         Raises:
             LayoutNotBuiltError:
                 If the layout has not been built yet.
         """
-        log = self.method_logger
+        log = self._log
 
         if not self.built:
             log.warning('Attempted to rebuild layout when it was not built yet!')
             raise LayoutNotBuiltError('Cannot rebuild layout when it was not built yet!')
 
-        log.debug('Rebuilding layout...')
-        log.debug('Clearing current layout...')
-
         self.__layout   = None
-        log.debug('Layout set to None.')
         self.__is_built = False
-        log.debug('Layout marked as not built.')
-        log.debug('Building new layout and returning...')
+        log.debug('Cleared current layout; rebuilding...')
 
         return self.build()
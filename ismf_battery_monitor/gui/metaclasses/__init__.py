@@ -13,8 +13,14 @@ class SingletonABCMeta(ABCMeta):
     _lock = Lock()
 
     def __call__(cls, *args, **kwargs):
+        # Fast path; once the instance exists there's nothing to guard.
+        instance = SingletonABCMeta._instances.get(cls)
+        if instance is not None:
+            return instance
+
         with SingletonABCMeta._lock:
-            if cls not in SingletonABCMeta._instances:
+            instance = SingletonABCMeta._instances.get(cls)
+            if instance is None:
                 instance = super().__call__(*args, **kwargs)
                 SingletonABCMeta._instances[cls] = instance
-            return SingletonABCMeta._instances[cls]
+            return instance
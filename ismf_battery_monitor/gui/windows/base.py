@@ -91,10 +91,7 @@ class WindowBase(metaclass=SingletonABCMeta):
 
     @property
     def built(self):
-        try:
-            return bool(self.layout) and bool(self.window)
-        except RuntimeError:
-            return False
+        return self.__window is not None
 
     @property
     def initialized(self):
@@ -257,19 +254,19 @@ class WindowBase(metaclass=SingletonABCMeta):
         if self.running:
             self.stop()
 
-        if self.layout:
-            self.layout.rebuild()
+        if self._layout is not None:
+            self.LAYOUT.rebuild()
 
     def build(self):
         if self.built:
             raise RuntimeError('Window already built.')
-        self.LAYOUT.build()
-        self._layout = self.LAYOUT.layout
-        self.__window = psg.Window(self.title, layout=self.layout, finalize=True)
+        self.__window = psg.Window(self.title, layout=self.LAYOUT.build(), finalize=True)
+        # Refer to the rows the window finalized rather than keeping a reference of our own to the layout.
+        self._layout  = self.__window.Rows
         if getattr(self, '__post_build__', None):
             print('post_build')
     def build_event_handlers(self):
-        if not self.EVENT_COLLECTION.events:
+        if not len(self.EVENT_COLLECTION):
             raise RuntimeError('No event handlers found to build!')
 
     def close(self):
@@ -283,10 +280,12 @@ class WindowBase(metaclass=SingletonABCMeta):
         self.window.close()
 
     def handle_event(self, event, values):
-        for handler in self.EVENT_COLLECTION:
-            if handler.key == event:
+        # Look the event up in the collection's own key map, so events added at any point are seen, and a window
+        # without events just ignores what it reads. Keys are stored upper-case; `None` is the window's exit event.
+        handler = self.EVENT_COLLECTION.get(event.upper() if isinstance(event, str) else event)
 
-                handler.callback
+        if handler is not None and handler.callback is not None:
+            handler.handle(callback_args=(values,))
 
     def run(self):
         if not self.built:
@@ -3,24 +3,41 @@ from ..base import WindowBase
 from is_matrix_forge.led_matrix.hardware import brightness
 from is_matrix_forge.led_matrix.helpers.device import DEVICES
 from is_matrix_forge.monitor.monitor import PowerMonitor
-import time
+from threading import Timer
 
 
-POWER_MONITOR = PowerMonitor(DEVICES[0])
+DEVICE        = DEVICES[0]
+EXIT_EVENTS   = frozenset({None, 'EXIT_BTTN'})
+POWER_MONITOR = PowerMonitor(DEVICE)
 
 
 class MainWindow(WindowBase):
     """
     Main window for the LED Matrix Battery Monitor GUI.
     """
-    DEFAULT_TITLE = 'LED Matrix Battery Monitor'
-    LAYOUT        = MainWindowLayout()
+    DEFAULT_TITLE             = 'LED Matrix Battery Monitor'
+    BRIGHTNESS_DEBOUNCE_DELAY = 0.3
+
+    @property
+    def LAYOUT(self) -> MainWindowLayout:
+        # `MainWindowLayout` is a singleton; it's created on first use rather than when this module is imported.
+        return MainWindowLayout()
 
     def __init__(
             self,
             *args,
             **kwargs
     ):
+        # Set before `super().__init__`, which may build and run the window straight away.
+        self._brightness_timer = None
+        self._last_brightness  = None
+        self._event_dispatch   = {
+            **dict.fromkeys(EXIT_EVENTS, self._on_exit),
+            'BRIGHTNESS_SLIDER':      self._on_brightness_slider,
+            'BRIGHTNESS_APPLY':       self._on_brightness_apply,
+            'BRIGHTNESS_SLIDER_DONE': self._on_brightness_slider_done,
+        }
+
         if not args and 'title' not in kwargs:
             args = (MainWindow.DEFAULT_TITLE, *args)
         super().__init__(*args, **kwargs)
@@ -32,22 +49,53 @@ class MainWindow(WindowBase):
             lambda event, s=slider_elem: self.window.write_event_value('BRIGHTNESS_SLIDER_DONE', s.get())
         )
 
+    def _apply_brightness(self, value: int):
+        # Dragging and releasing the slider can deliver the same value more than once; only write changes.
+        if value != self._last_brightness:
+            brightness(DEVICE, value)
+            self._last_brightness = value
+
+    def _cancel_brightness_timer(self):
+        if self._brightness_timer is not None:
+            self._brightness_timer.cancel()
+            self._brightness_timer = None
+
+    def _schedule_brightness(self, value: int):
+        """
+        Apply `value` to the matrix once the slider has been still for `BRIGHTNESS_DEBOUNCE_DELAY` seconds.
+
+        Each call restarts the countdown; when it expires a `BRIGHTNESS_APPLY` event is posted to the window.
+        """
+        self._cancel_brightness_timer()
+        self._brightness_timer = Timer(
+            self.BRIGHTNESS_DEBOUNCE_DELAY,
+            self.window.write_event_value,
+            args=('BRIGHTNESS_APPLY', value)
+        )
+        self._brightness_timer.daemon = True
+        self._brightness_timer.start()
+
     def build_event_handlers(self):
         self.EVENT_COLLECTION.create_event(None, self.stop)
 
-    def handle_event(self, event, *args, **kwargs):
-        values = args[0] if args else {}
+    def _on_exit(self, values):
+        self.stop()
+
+    def _on_brightness_slider(self, values):
+        self._schedule_brightness(int(values.get('BRIGHTNESS_SLIDER', 0)))
 
-        if event in (None, 'EXIT_BTTN'):
-            self.stop()
-            return
+    def _on_brightness_apply(self, values):
+        self._apply_brightness(int(values.get('BRIGHTNESS_APPLY', 0)))
 
-        if event == 'BRIGHTNESS_SLIDER':
-            brightness(DEVICES[0], int(values.get('BRIGHTNESS_SLIDER', 0)))
-            return
+    def _on_brightness_slider_done(self, values):
+        self._cancel_brightness_timer()
+        self._apply_brightness(int(values.get('BRIGHTNESS_SLIDER_DONE', 0)))
 
-        if event == 'BRIGHTNESS_SLIDER_DONE':
-            brightness(DEVICES[0], int(values.get('BRIGHTNESS_SLIDER_DONE', 0)))
+    def handle_event(self, event, *args, **kwargs):
+        handler = self._event_dispatch.get(event)
+
+        if handler is not None:
+            handler(args[0] if args else {})
 
     def run(self):
         if not self.built:
@@ -56,22 +104,13 @@ class MainWindow(WindowBase):
         if not self.running:
             raise RuntimeError('Window is not running. Call start() first.')
 
-        DEBOUNCE_DELAY = 0.3
-        last_change = 0
-        pending_value = None
-
+        # Block until something happens; slider debouncing is driven by `BRIGHTNESS_APPLY` events.
         while self.running:
-            event, values = self.window.read(timeout=100)
-
-            if event == 'BRIGHTNESS_SLIDER':
-                pending_value = int(values['BRIGHTNESS_SLIDER'])
-                last_change = time.time()
-
-            if pending_value is not None and time.time() - last_change > DEBOUNCE_DELAY:
-                brightness(DEVICES[0], pending_value)
-                pending_value = None
+            event, values = self.window.read()
 
             self.handle_event(event, values)
 
             if event is None:
                 break
+
+        self._cancel_brightness_timer()
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 import PySimpleGUI as psg
 from is_matrix_forge.monitor.gui.layout.base import Layout as BaseLayout
 
@@ -9,13 +11,15 @@ MOD_LOGGER = PARENT_LOGGER.get_child('monitor.gui.windows.main.layout')
 
 
 class Layout(BaseLayout):
-    @property
+    @cached_property
     def BLUEPRINT(self):
-        return [
+        # Built once and frozen; `Layout.build` copies it for each window, so the same elements are never handed out
+        # twice.
+        return (
 
-            [psg.Text('Brightness'), psg.Slider((0, 255), key='BRIGHTNESS_SLIDER', enable_events=True)],
-            [psg.Button('Animate'), psg.Checkbox('Animated', key='ANIMATED_CHKBOX'),
-             psg.Button('Exit', key='EXIT_BTTN')],
+            (psg.Text('Brightness'), psg.Slider((0, 255), key='BRIGHTNESS_SLIDER', enable_events=True)),
+            (psg.Button('Animate'), psg.Checkbox('Animated', key='ANIMATED_CHKBOX'),
+             psg.Button('Exit', key='EXIT_BTTN')),
 
-        ].copy()
+        )
 
@@ -1,9 +1,52 @@
 import psutil
-from psutil import sensors_battery as get_battery_info
+from psutil import sensors_battery
+from time import monotonic
 from .errors import BatteryStateUnknownError
 from typing import Optional
 
 
+BATTERY_INFO_TTL = 1.0
+"""The number of seconds a battery reading is reused before :func:`psutil.sensors_battery` is queried again."""
+
+_battery_info_cache: Optional[tuple] = None
+
+
+def get_battery_info(max_age: Optional[float] = None) -> Optional[psutil._common.sbattery]:
+    """
+    Retrieves the system's battery information, reusing a recent reading if there is one.
+
+    Args:
+        max_age (Optional[float]):
+            The maximum age (in seconds) of a cached reading that may be returned. Defaults to
+            :data:`BATTERY_INFO_TTL`. Pass `0` to force a fresh reading.
+
+    Returns:
+        Optional[psutil._common.sbattery]:
+            The battery information, or `None` if the system has no battery.
+    """
+    global _battery_info_cache
+
+    if max_age is None:
+        max_age = BATTERY_INFO_TTL
+
+    now = monotonic()
+    cached = _battery_info_cache
+
+    if cached is None or now - cached[0] >= max_age:
+        cached = _battery_info_cache = (now, sensors_battery())
+
+    return cached[1]
+
+
+def invalidate_battery_cache() -> None:
+    """
+    Discards the cached battery reading, so the next call to :func:`get_battery_info` queries psutil.
+    """
+    global _battery_info_cache
+
+    _battery_info_cache = None
+
+
 def get_plugged_status(battery_info: Optional[psutil._common.sbattery] = None) -> bool:
     """
     Retrieves the plugged-in status of the system.
@@ -31,7 +74,10 @@ def get_plugged_status(battery_info: Optional[psutil._common.sbattery] = None) -
         - :func:`psutil.sensors_battery`
         - :exc:`BatteryStateUnknownError`
     """
-    return check_plugged_in()
+    if battery_info is None:
+        return check_plugged_in()
+
+    return battery_info.power_plugged
 
 
 def check_plugged_in():
@@ -1,8 +1,7 @@
 
 import time
 from pathlib import Path
-from threading import Thread
-from time import sleep
+from threading import Event, Thread
 from typing import Optional, Union
 
 from inspy_logger import Loggable
@@ -15,37 +14,64 @@ from is_matrix_forge.led_matrix.display.animations import goodbye_animation
 from is_matrix_forge.led_matrix.helpers.device import check_device
 from is_matrix_forge.monitor import DEFAULT_PLUGGED_SOUND, DEFAULT_UNPLUGGED_SOUND, MOD_LOGGER, PowerMonitorNotRunningError, ECH
 from is_matrix_forge.notify.sounds import Sound
-from is_matrix_forge.monitor.helpers import get_battery_percentage
 
-from is_matrix_forge.monitor.helpers import get_battery_percentage, get_plugged_status
-from psutil import sensors_battery
+from .helpers import get_battery_info, get_plugged_status
 
 
 class PowerMonitor(Loggable):
 
     # Properties
     #
-    _running         = False
-    DEFAULT_CHECK_INTERVAL = 5
-    __cycles         = 0
+    DEFAULT_CHECK_INTERVAL = 30
+    UNPLUGGED_INTERVAL     = 60
+
+    # `Loggable` doesn't define `__slots__`, so instances keep a `__dict__` for its attributes; slotting ours still
+    # gives the monitor loop fixed-offset access to them.
+    __slots__ = (
+        '__controller',
+        '__dev',
+        '__plugged_alert',
+        '__plugged_interval',
+        '__stop_event',
+        '__unplugged_alert',
+        '__unplugged_interval',
+        '_cycles',
+        '_ech_registered',
+        '_last_drawn_percentage',
+        '_last_snapshot',
+        '_last_state',
+        '_running',
+        '_start_time',
+        '_stop_time',
+        '_thread',
+    )
 
     def __init__(
             self,
             device,
-            battery_check_interval: int = 5,
+            battery_check_interval: Optional[Union[int, float, str]] = None,
+            plugged_interval: Optional[Union[int, float, str]] = None,
+            unplugged_interval: Optional[Union[int, float, str]] = None,
             plugged_alert: Optional[Union[str, Path]] = DEFAULT_PLUGGED_SOUND,
             unplugged_alert: Optional[Union[str, Path]] = DEFAULT_UNPLUGGED_SOUND,
 
     ):
         super().__init__(MOD_LOGGER)
-        self.__battery_check_interval = None
+        self._cycles                 = 0
         self.__dev                    = None
+        self._ech_registered         = False
+        self._last_drawn_percentage  = None
+        self._last_snapshot          = None
         self._last_state             = None
         self.__plugged_alert          = None
-        self.__start_time             = None
-        self.__stop_time              = None
-        self.__thread                 = None
+        self.__plugged_interval       = None
+        self._running                = False
+        self._start_time             = None
+        self.__stop_event             = Event()
+        self._stop_time              = None
+        self._thread                 = None
         self.__unplugged_alert        = None
+        self.__unplugged_interval     = None
         self.__controller             = None
 
         self.set_device(device)
@@ -59,22 +85,38 @@ class PowerMonitor(Loggable):
             self.unplugged_alert = unplugged_alert
 
         self.dev.brightness = percentage_to_value(5)
-        self.__battery_check_interval = battery_check_interval or self.DEFAULT_CHECK_INTERVAL
+
+        # An explicit `battery_check_interval` applies to both power states unless a per-state interval is given.
+        # Assigned through the properties, so the values are validated (and converted to `float`) up front.
+        self.plugged_interval   = plugged_interval or battery_check_interval or self.DEFAULT_CHECK_INTERVAL
+        self.unplugged_interval = unplugged_interval or battery_check_interval or self.UNPLUGGED_INTERVAL
 
     @property
     def battery_check_interval(self):
         """
+        The interval (in seconds) shared by both power states.
+
+        The monitor loop itself waits `plugged_interval` or `unplugged_interval`, depending on the power state;
+        setting this property sets both of them to the new value.
 
         Returns:
+            Optional[float]:
+                The check interval, if `plugged_interval` and `unplugged_interval` are the same.
 
+                `None`;
+                    The two power states use different intervals (the default).
         """
-        return self.__battery_check_interval
+        if self.__plugged_interval == self.__unplugged_interval:
+            return self.__plugged_interval
+
+        return None
 
     @battery_check_interval.setter
     @validate_type(int, str, float, preferred_type=float, conversion_funcs=[float])
     def battery_check_interval(self, new):
 
-        self.__battery_check_interval = new
+        self.__plugged_interval   = new
+        self.__unplugged_interval = new
 
     @property
     def controller(self):
@@ -82,7 +124,7 @@ class PowerMonitor(Loggable):
 
     @property
     def cycles(self):
-        return self.__cycles
+        return self._cycles
 
     @property
     def dev(self):
@@ -139,10 +181,31 @@ class PowerMonitor(Loggable):
 
                 False;
                     The device is currently unplugged from power.
+
+        Note:
+            Battery readings are shared and reused for up to `helpers.BATTERY_INFO_TTL` seconds, so reading this
+            (or `unplugged`) repeatedly doesn't query the system each time.
         """
-        print(f'plugged status: {get_plugged_status()}')
         return get_plugged_status()
 
+    @property
+    def plugged_interval(self):
+        """
+        The number of seconds to wait between checks while the device is plugged into power. Defaults to
+        `DEFAULT_CHECK_INTERVAL`.
+
+        Returns:
+            float:
+                The check interval (in seconds) used while plugged in.
+        """
+        return self.__plugged_interval
+
+    @plugged_interval.setter
+    @validate_type(int, str, float, preferred_type=float, conversion_funcs=[float])
+    def plugged_interval(self, new):
+
+        self.__plugged_interval = new
+
     @property
     def running(self):
         """
@@ -195,15 +258,15 @@ class PowerMonitor(Loggable):
             float:
                 The run time in seconds.
         """
-        if not hasattr(self, 'start_time'):
+        if self._start_time is None:
             raise PowerMonitorNotRunningError('Monitor hasn\'t even been started yet!')
 
-        recent = self.stop_time if hasattr(self, 'stop_time') else time.time()
-        return recent - self.start_time
+        recent = self._stop_time if self._stop_time is not None else time.time()
+        return recent - self._start_time
 
     @property
     def start_time(self) -> Optional[float]:
-        return self.__start_time
+        return self._start_time
 
     @property
     def stop_time(self) -> Optional[float]:
@@ -220,7 +283,7 @@ class PowerMonitor(Loggable):
                     The monitor hasn't been stopped yet
 
         """
-        return self.__stop_time
+        return self._stop_time
 
     @property
     def thread(self) -> Optional[Thread]:
@@ -233,10 +296,10 @@ class PowerMonitor(Loggable):
                 The thread that is running the monitor loop; if the monitor is running in a separate thread.
                 None otherwise
         """
-        if self.__thread is None:
+        if self._thread is None:
             self.class_logger.error('Either monitor is not running or it is not running in a separate thread.')
 
-        return self.__thread
+        return self._thread
 
     @property
     def unplugged(self):
@@ -254,7 +317,7 @@ class PowerMonitor(Loggable):
                         - The battery level is not decreasing
                         - The battery is gaining a net-positive charge level
         """
-        return not self.plugged_in
+        return not get_plugged_status()
 
     @property
     def unplugged_alert(self) -> 'Sound':
@@ -288,6 +351,25 @@ class PowerMonitor(Loggable):
 
         self.__unplugged_alert = new
 
+    @property
+    def unplugged_interval(self):
+        """
+        The number of seconds to wait between checks while the device is running on battery. This is longer than
+        `plugged_interval` by default (`UNPLUGGED_INTERVAL`), so the monitor wakes the system less often while it is
+        discharging.
+
+        Returns:
+            float:
+                The check interval (in seconds) used while unplugged.
+        """
+        return self.__unplugged_interval
+
+    @unplugged_interval.setter
+    @validate_type(int, str, float, preferred_type=float, conversion_funcs=[float])
+    def unplugged_interval(self, new):
+
+        self.__unplugged_interval = new
+
     def notify(self, which: str):
         """
         Notify the user of a power event (plugged, unplugged).
@@ -306,12 +388,12 @@ class PowerMonitor(Loggable):
         if which.lower() == 'plugged':
             log.debug('Status: Plugged in')
             if not self.last_state:
-                log.debug(f'Using {self.plugged_alert} to notify user...')
+                log.debug('Using %s to notify user...', self.plugged_alert)
                 self.plugged_alert.notify()
         elif which.lower() == 'unplugged':
             log.debug('Status: Unplugged')
             if self.last_state:
-                log.debug(f'Using {self.unplugged_alert} to notify user...')
+                log.debug('Using %s to notify user...', self.unplugged_alert)
                 self.unplugged_alert.notify()
 
     def run(self):
@@ -326,7 +408,7 @@ class PowerMonitor(Loggable):
         Note:
             This method is called by the `start` method and should not be called directly.
         """
-        from .events import handle_event
+        from .events import handle_event, refresh_percentage
         log = self.method_logger
         if not self._running:
             log.error('Monitor is not running')
@@ -336,38 +418,53 @@ class PowerMonitor(Loggable):
 
         while self.running:
             
-            state = 'plugged' if self.plugged_in else 'unplugged'
-            log.debug(f'Power plugged {state}')
-            handle_event(state, self)
+            # Take one fresh reading per cycle; the event handlers reuse it through `_last_snapshot`.
+            snapshot = self._last_snapshot = get_battery_info(max_age=0)
+            plugged = get_plugged_status(snapshot)
+
+            # Only dispatch the event handlers on a power-state transition (or until the first one has been handled);
+            # the handlers record the new `last_state` once they've acted on it.
+            if plugged != self._last_state:
+                state = 'plugged' if plugged else 'unplugged'
+                log.debug('Power plugged %s', state)
+                handle_event(state, self)
+            elif not plugged:
+                # Steady on battery; the percentage readout is the only thing that may need updating.
+                refresh_percentage(self)
 
             if not self.running:
                 log.debug('Monitor stopped, stopping monitor...')
                 self.controller.clear()
                 break
 
-            self.__cycles += 1
-            print(self.cycles)
-            print(self.cycles % 10)
+            self._cycles += 1
 
-            if self.cycles % 10 == 0:
-                # every 10 cycles announce to debug log cycle count
-                log.debug(f'Cycle count: {self.cycles}')
+            if (self._cycles & 31) == 0:
+                # every 32 cycles announce to debug log cycle count
+                log.debug('Cycle count: %d', self._cycles)
 
-            sleep(self.battery_check_interval)
+            # Wait out the interval, but wake immediately if `stop()` is called meanwhile.
+            interval = self.plugged_interval if plugged else self.unplugged_interval
+            if self.__stop_event.wait(interval):
+                break
+
+        # A threaded loop may have taken one last reading while `stop()` ran; drop that too.
+        self._last_snapshot = None
 
     def set_device(self, device):
 
         if isinstance(device, LEDMatrixController):
+            # Use the caller's controller as-is; its device has already been opened.
             self.__controller = device
-            device = self.controller.device
-        elif not isinstance(device, ListPortInfo):
-            raise TypeError(f'device must be of type `ListPortInfo`, not {type(device)}')
-
-        if not check_device(device):
-            raise ValueError(f'device {device} is not available')
+            self.__dev = device.device
+        elif isinstance(device, ListPortInfo):
+            if not check_device(device):
+                raise ValueError(f'device {device} is not available')
 
-        self.__dev = device
-        self.__controller = LEDMatrixController(self.dev)
+            self.__dev = device
+            self.__controller = LEDMatrixController(device)
+        else:
+            raise TypeError(f'device must be of type `ListPortInfo`, not {type(device)}')
 
     def start(self, threaded=False):
         """
@@ -390,14 +487,23 @@ class PowerMonitor(Loggable):
             log.warning('Monitor is already running')
             raise RuntimeError('Monitor is already running')
 
+        self.__stop_event.clear()
         self._running = True
+        self._last_drawn_percentage = None
+        self._last_snapshot = None
         log.debug('Set running to True')
-        self.__start_time = time.time()
+        self._start_time = time.time()
+        self._stop_time = None
 
         if threaded:
-            t = Thread(target=self.run, daemon=True)
-            t.start()
-            ECH.register_handler(self.stop, kwargs={'reason': 'Program exited.'})
+            if not self._ech_registered:
+                # Registered once per monitor; the handler is a no-op if the monitor was already stopped.
+                ECH.register_handler(self._stop_at_exit)
+                self._ech_registered = True
+
+            self._thread = Thread(target=self.run, daemon=True)
+            self._thread.start()
+            return self._thread
 
         try:
             self.run()
@@ -405,9 +511,16 @@ class PowerMonitor(Loggable):
             log.warning('KeyboardInterrupt received, stopping monitor...')
             self.stop(without_salutation=True, reason='Keyboard interrupt.')
 
+    def _stop_at_exit(self):
+        """
+        Stop the monitor when the program exits, if it's still running.
+        """
+        if self.running:
+            self.stop(reason='Program exited.')
+
     def stop(self, without_salutation=False, reason=None):
         """
-        Stop the power monitor.
+        Stop the power monitor. Calling this on a monitor that isn't running does nothing.
 
         Parameters:
             without_salutation (bool):
@@ -417,16 +530,21 @@ class PowerMonitor(Loggable):
         log = self.method_logger
 
         if not self.running:
-            log.error('Monitor is not running')
-            raise PowerMonitorNotRunningError("Can't call stop() on a monitor that is not running")
-        else:
-            log.debug('Stopping monitor...')
-        self.__stop_time = time.time()
+            # Stopping is idempotent; the exit handler or a second caller may get here after the monitor has stopped.
+            log.debug('Monitor is already stopped, nothing to do.')
+            return
+
+        log.debug('Stopping monitor...')
+        self._stop_time = time.time()
         self.running = False
+        self.__stop_event.set()
+
+        # Don't let handlers called after this act on the final cycle's (ever more stale) reading.
+        self._last_snapshot = None
         log.debug('"running" flag set to False...waiting for thread to finish')
 
         if reason:
-            log.info(f'Stopping monitor due to: {reason}')
+            log.info('Stopping monitor due to: %s', reason)
         else:
             log.info('Stopping monitor. With no reason.')
 
@@ -436,7 +554,12 @@ class PowerMonitor(Loggable):
             log.debug('Skipping goodbye salutation...')
 
         if self.controller.animating:
-            self.controller.animating = True
+            self.controller.animating = False
+        elif without_salutation and self._last_state is None and self._last_drawn_percentage is None:
+            # Nothing was ever drawn (no state handled, no percentage, no goodbye animation), so there's nothing to
+            # clear.
+            log.debug('LED matrix untouched, skipping clear...')
+            return
 
         log.debug('Clearing LED matrix...')
         self.controller.clear()
@@ -1,5 +1,5 @@
 from chime import play_wav
-from .files import AUDIO_MAP as PLUG_ALERT_MAP
+from .files import AUDIO_MAP as PLUG_ALERT_MAP, _ensured
 from is_matrix_forge.log_engine import ROOT_LOGGER as PARENT_LOGGER
 
 
@@ -17,16 +17,18 @@ def alert(alert_type: str):
     log = MOD_LOGGER.get_child('alert')
 
     if not isinstance(alert_type, str):
-        log.error(f'"alert_type" must be a string, not {type(alert_type)}')
+        log.error('"alert_type" must be a string, not %s', type(alert_type))
         raise TypeError(f'alert_type must be a string, not {type(alert_type)}')
 
     alert_type = alert_type.lower().strip()
-    log.debug(f'Checking if alert_type is valid: {alert_type} ({type(alert_type)})')
+    log.debug('Checking if alert_type is valid: %s (%s)', alert_type, type(alert_type))
     if alert_type not in PLUG_ALERT_MAP:
-        log.error(f'Invalid alert_type: {alert_type}')
+        log.error('Invalid alert_type: %s', alert_type)
         raise ValueError(f'alert_type must be one of {", ".join(PLUG_ALERT_MAP.keys())}')
 
-    log.debug(f'Playing alert sound: {alert_type}')
+    _ensured()
+
+    log.debug('Playing alert sound: %s', alert_type)
     play_wav(PLUG_ALERT_MAP[alert_type])
 
 
@@ -1,3 +1,6 @@
+import os
+import stat
+from functools import lru_cache
 from pathlib import Path
 from is_matrix_forge.log_engine import ROOT_LOGGER as PARENT_LOGGER
 
@@ -6,7 +9,6 @@ MOD_LOGGER = PARENT_LOGGER.get_child('assets.audio.files')
 
 
 CUR_DIR = Path(__file__).parent.expanduser().resolve().absolute()
-MOD_LOGGER.debug(f'Audio files directory: {CUR_DIR}')
 
 AUDIO_MAP = {
     'plugged': CUR_DIR / 'plugged.wav',
@@ -28,24 +30,41 @@ def integrity_check():
     log = MOD_LOGGER.get_child('integrity_check')
     log.debug('Checking audio files...')
     for file in AUDIO_MAP.values():
-        log.debug(f'Checking file: {file}')
-        if not file.exists():
-            log.error(f'File not found: {file}')
+        log.debug('Checking file: %s', file)
+        try:
+            st = os.stat(file)
+        except FileNotFoundError:
+            log.error('File not found: %s', file)
             raise FileNotFoundError(f'Audio file not found: {file}')
 
-        if not file.is_file():
-            log.error(f'File is not a file: {file}')
+        if not stat.S_ISREG(st.st_mode):
+            log.error('File is not a file: %s', file)
             raise FileNotFoundError(f'Audio file not found: {file}')
 
     log.debug('Audio files are valid.')
     return True
 
 
-MOD_LOGGER.debug('Performing integrity check...')
+@lru_cache()
+def _ensured():
+    """
+    Runs :func:`integrity_check` the first time it's called, and remembers the result after that.
 
-if not integrity_check():
-    MOD_LOGGER.error('Audio files are invalid.')
-    raise FileNotFoundError('Audio files are invalid.')
+    Raises:
+        FileNotFoundError:
+            If the audio files are invalid.
+
+    Returns:
+        bool:
+            True, once the audio files have been found to be valid.
+    """
+    MOD_LOGGER.debug('Performing integrity check...')
+
+    if not integrity_check():
+        MOD_LOGGER.error('Audio files are invalid.')
+        raise FileNotFoundError('Audio files are invalid.')
+
+    return True
 
 
 __all__ = [
@@ -1,6 +1,24 @@
+from functools import lru_cache
+
 from .base import Sound
 from ..audio import PLUG_ALERT_MAP
 
 
-PLUGGED_NOTIFY   = Sound(PLUG_ALERT_MAP['plugged'], 'plugged')
-UNPLUGGED_NOTIFY = Sound(PLUG_ALERT_MAP['unplugged'], 'unplugged')
+@lru_cache(None)
+def get_sound(kind: str) -> Sound:
+    """
+    Get the shared `Sound` for one of the bundled alerts, creating it the first time it's asked for.
+
+    Parameters:
+        kind (str):
+            The kind of alert ('plugged' or 'unplugged').
+
+    Returns:
+        Sound:
+            The `Sound` that plays the bundled alert for `kind`.
+    """
+    return Sound(PLUG_ALERT_MAP[kind], kind)
+
+
+PLUGGED_NOTIFY   = get_sound('plugged')
+UNPLUGGED_NOTIFY = get_sound('unplugged')
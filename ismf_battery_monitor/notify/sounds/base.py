@@ -1,37 +1,78 @@
-from abc import ABC, abstractmethod
+import atexit
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Union, Optional
 
 from chime import play_wav
 
+try:
+    import winsound
+except ImportError:
+    winsound = None
+
 from inspyre_toolbox.syntactic_sweets.classes.decorators.aliases import add_aliases, method_alias
 
 from is_matrix_forge.log_engine import ROOT_LOGGER as PARENT_LOGGER
 from is_matrix_forge.assets.audio import PLUG_ALERT_MAP
 
+from ..audio.files import _ensured
+
 
 MOD_LOGGER = PARENT_LOGGER.get_child('notify.sounds.base')
 
+# Plays notifications off the caller's thread (one at a time), so the monitor loop never waits on audio.
+_PLAYER = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sound')
+atexit.register(_PLAYER.shutdown)
+
+
+def _log_playback_failure(future) -> None:
+    """
+    Log the error a playback job raised, as nothing else waits on its result.
+    """
+    if future.cancelled():
+        return
+
+    error = future.exception()
+    if error is not None:
+        MOD_LOGGER.error('Unable to play notification sound: %s', error)
+
 
 @add_aliases
-class Sound(ABC):
+class Sound:
     """
-    Abstract base class for audio notifications.
+    An audio notification, played when the device is plugged into or unplugged from power.
+
+    A `Sound` is validated once, on construction; its `notify_type` and `wav_file_path` are read-only after that.
     """
-    __allowed_types: set = {'plugged', 'unplugged'}
+    __slots__ = ('_notify_type', '_preloaded', '_wav_bytes', '_wav_file', '_wav_path_str')
+
+    __allowed_types: frozenset = frozenset({'plugged', 'unplugged'})
 
     def __init__(
             self,
             wav_file: Union[str, Path],
             notify_type: str,
     ) -> None:
-        self.__initialized = False
-        self.__notify_type = None
-        self.__wav_file    = None
+        if isinstance(wav_file, str):
+            wav_file = Path(wav_file)
+
+        if not isinstance(wav_file, Path):
+            raise TypeError(f'wav_file must be of type `str` or `Path`, not {type(wav_file)}')
+
+        if not isinstance(notify_type, str):
+            raise TypeError(f'notify_type must be of type `str`, not {type(notify_type)}')
 
-        self.wav_file_path = wav_file
-        self.notify_type   = notify_type
-        # Initialize here
+        if notify_type not in self.__allowed_types:
+            raise ValueError(f'notify_type must be one of {self.__allowed_types}, not {notify_type}')
+
+        self._notify_type = notify_type
+        self._preloaded   = False
+        self._wav_bytes   = None
+        self._wav_file    = wav_file
+
+        # Handed to the audio backend as-is, so it doesn't have to re-stringify the path on every notification.
+        self._wav_path_str = os.fspath(wav_file)
 
     @property
     def ALLOWED_TYPES(self):
@@ -39,55 +80,51 @@ class Sound(ABC):
         The allowed values for the notify_type property. Read-only property.
 
         Returns:
-            set[str]:
+            frozenset[str]:
                 A set of allowed notify-types.
         """
         return self.__allowed_types
 
     @property
-    def notify_type(self):
-        return self.__notify_type
-
-    @notify_type.setter
-    def notify_type(self, new: str) -> None:
-        if self.__initialized:
-            raise RuntimeError('Cannot change notify type after initialization@')
-
-        if not isinstance(new, str):
-            raise TypeError(f'new must be of type `str`, not {type(new)}')
+    def notify_type(self) -> str:
+        """
+        The kind of power event this sound announces ('plugged' or 'unplugged'). Read-only property.
 
-        if new not in self.ALLOWED_TYPES:
-            raise ValueError(f'new must be one of {self.ALLOWED_TYPES}, not {new}')
-        
-        self.__notify_type = new
+        Returns:
+            str:
+                The notify-type.
+        """
+        return self._notify_type
 
     @property
     def wav_file_path(self) -> Path:
         """
-        Get the path to the .wav file that will be played.
+        Get the path to the .wav file that will be played. Read-only property; it's set on construction, as
+        changing it afterward would break the sound.
 
         Returns:
             Path:
                 The path to the .wav file.
         """
-        return self.__wav_file
+        return self._wav_file
 
-    @wav_file_path.setter
-    def wav_file_path(self, new: Union[str, Path]) -> None:
-        """
-        Set the path to the .wav file that will be played. Setting this should be done during initialization. After
-        initialization, this should not (and will not) be changed, as it will break the sound.
+    def __preload(self) -> None:
         """
-        if self.__initialized:
-            raise RuntimeError('Cannot change wave file path after initialization.')
+        Read the .wav file into memory once, on the first notification, so later ones don't have to re-open it
+        from disk (and importing the default sounds doesn't touch the disk at all).
 
-        if isinstance(new, str):
-            new = Path(new)
+        Only done where the audio backend can play from memory (Windows); elsewhere, and if the read fails,
+        `notify` falls back to playing the file by path.
+        """
+        self._preloaded = True
 
-        if not isinstance(new, Path):
-            raise TypeError(f'new must be of type `str` or `Path`, not {type(new)}')
+        if winsound is None:
+            return
 
-        self.__wav_file = new
+        try:
+            self._wav_bytes = self._wav_file.read_bytes()
+        except OSError as e:
+            MOD_LOGGER.warning('Unable to preload %s, will play it from disk instead: %s', self.wav_file_path, e)
 
     @method_alias('play')
     def notify(self) -> None:
@@ -97,7 +134,17 @@ class Sound(ABC):
         Returns:
             None
         """
-        play_wav(self.wav_file_path)
+        _ensured()
+
+        if not self._preloaded:
+            self.__preload()
+
+        if self._wav_bytes is not None:
+            job = _PLAYER.submit(winsound.PlaySound, self._wav_bytes, winsound.SND_MEMORY)
+        else:
+            job = _PLAYER.submit(play_wav, self._wav_path_str)
+
+        job.add_done_callback(_log_playback_failure)
 
     def __repr__(self):
         return f"<Sound notify_type={self.notify_type!r} wav_file_path={self.wav_file_path!r}>"